@@ -1,53 +1,148 @@
-# ai_interface.py
-
-import os
-import json
-import google.generativeai as genai
-
-# This is the "brain" we designed in Phase 2. It's much more detailed.
-PRIMORDIA_SYSTEM_PROMPT = """
-You are Primordia, the AI Chronicler for a text-based evolution simulation game.
-Your tone is a mix of a scientific nature documentary narrator (like David Attenborough) and a wise, ancient entity.
-You have a two-step job each game turn:
-
-1.  **FIRST MESSAGE:** You will receive a large JSON object with the complete game state. Your task is to synthesize this data into a short (2-4 sentences), evocative, and scientific narrative for the player. Describe the state of their lineage and the world. Mention any active world events or dominant threats. End your response by asking the player for their command, presenting them with their available choices. **Do not output any JSON in this step.**
-
-2.  **SECOND MESSAGE:** You will receive a short text string which is the player's chosen command. Your task is to formalize this choice. Your FINAL output for this message MUST be a single, valid JSON object with one key: "command_to_execute". The value must be a single string matching one of the original choices (e.g., "increase_toxin_resistance"). **Do not add any other text or explanation outside of this final JSON object.**
-"""
-
-class AIInterface:
-    """
-    Connects to the live Google Gemini API and manages the two-step conversational flow.
-    """
-    def __init__(self):
-        try:
-            api_key = os.environ["GOOGLE_API_KEY"]
-            genai.configure(api_key=api_key)
-            print("[AI Interface] API key found. Connecting to Google AI.")
-        except KeyError:
-            raise ConnectionError("ERROR: GOOGLE_API_KEY environment variable not set. The AI is offline.")
-
-        self.model = genai.GenerativeModel(
-            model_name='gemini-1.5-flash',
-            system_instruction=PRIMORDIA_SYSTEM_PROMPT
-        )
-        self.chat = None # Will hold the chat session for a turn
-
-    def start_new_turn(self, game_state_json: str) -> str:
-        """Starts a new turn by sending the game state to get the narrative."""
-        self.chat = self.model.start_chat()
-        response = self.chat.send_message(game_state_json)
-        return response.text
-
-    def get_player_command(self, player_input: str) -> dict:
-        """Sends the player's text choice to get the final JSON command."""
-        if not self.chat:
-            raise RuntimeError("Must start a new turn before getting a player command.")
-        
-        try:
-            response = self.chat.send_message(player_input)
-            cleaned_text = response.text.strip().replace("```json", "").replace("```", "")
-            return json.loads(cleaned_text)
-        except Exception as e:
-            print(f"AI command parsing error: {e}. Defaulting to 'wait'.")
-            return {"command_to_execute": "wait"}
\ No newline at end of file
+# ai_interface.py
+
+import os
+import re
+import orjson
+import google.generativeai as genai
+from collections import OrderedDict
+
+# The four commands the game understands; the response schema constrains the
+# model to this set so no second "formalize the choice" round trip is needed.
+VALID_COMMANDS = (
+    "increase_toxin_resistance",
+    "decrease_metabolism",
+    "improve_sensing",
+    "wait",
+)
+
+# This is the "brain" we designed in Phase 2. It's much more detailed.
+PRIMORDIA_SYSTEM_PROMPT = """
+You are Primordia, the AI Chronicler for a text-based evolution simulation game.
+Your tone is a mix of a scientific nature documentary narrator (like David Attenborough) and a wise, ancient entity.
+
+Each game turn you receive a single JSON object with the complete game state,
+including the player's available choices. You respond with a single JSON object
+containing exactly two keys:
+
+1.  "narrative": Synthesize the game state into a short (2-4 sentences),
+    evocative, and scientific narrative for the player. Describe the state of
+    their lineage and the world. Mention any active world events or dominant
+    threats. End by asking the player for their command, presenting them with
+    their available choices.
+
+2.  "command_to_execute": The single choice you would recommend given the
+    current threats and the player's Evolutionary Potential. The value must be
+    one of the "choice" strings from the game state's "player_choices" list.
+"""
+
+# Fallback extractor for when the model wraps its JSON in fences or other
+# noise that breaks the full parse: a single non-backtracking scan for the
+# command field beats re-cleaning and re-parsing the whole response.
+_CMD_RE = re.compile(r'"command_to_execute"\s*:\s*"([a-z_]+)"')
+
+# JSON schema for the structured single-call response.
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "narrative": {"type": "string"},
+        "command_to_execute": {"type": "string", "enum": list(VALID_COMMANDS)},
+    },
+    "required": ["narrative", "command_to_execute"],
+}
+
+class AIInterface:
+    """
+    Connects to the live Google Gemini API. A single structured-output call per
+    turn returns both the narrative and a recommended command, halving the
+    network round trips of the old two-step conversation.
+    """
+    def __init__(self):
+        try:
+            api_key = os.environ["GOOGLE_API_KEY"]
+            genai.configure(api_key=api_key)
+            print("[AI Interface] API key found. Connecting to Google AI.")
+        except KeyError:
+            raise ConnectionError("ERROR: GOOGLE_API_KEY environment variable not set. The AI is offline.")
+
+        self.model = genai.GenerativeModel(
+            model_name='gemini-1.5-flash',
+            system_instruction=PRIMORDIA_SYSTEM_PROMPT,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": RESPONSE_SCHEMA,
+            },
+        )
+        self.recommended_command = "wait"
+        # LRU cache of (narrative, command) keyed by a bucketed state tuple:
+        # early-game turns produce near-identical states, and reusing the
+        # previous narrative for them avoids an API call entirely.
+        self._narrative_cache = OrderedDict()
+        self._narrative_cache_size = 64
+
+    async def start_new_turn(self, game_state_json: str) -> str:
+        """Requests the turn's narrative (and recommended command) in one call.
+
+        Async so the game loop can overlap the network round trip with the
+        simulation steps instead of blocking on it. States that bucket to a
+        previously seen key reuse the cached narrative without an API call.
+        """
+        key = self._cache_key(game_state_json)
+        cached = self._narrative_cache.get(key)
+        if cached is not None:
+            self._narrative_cache.move_to_end(key)
+            narrative, self.recommended_command = cached
+            return narrative
+
+        chunks = []
+        try:
+            # Stream the response so chunks are consumed while the model is
+            # still generating, instead of waiting for the full body. The
+            # JSON is schema-constrained, so the text is only printable once
+            # complete; streaming here overlaps transfer with generation.
+            response = await self.model.generate_content_async(
+                game_state_json, stream=True)
+            async for chunk in response:
+                chunks.append(chunk.text)
+            parsed = orjson.loads("".join(chunks))
+            self.recommended_command = parsed.get("command_to_execute", "wait")
+            narrative = parsed["narrative"]
+            self._narrative_cache[key] = (narrative, self.recommended_command)
+            if len(self._narrative_cache) > self._narrative_cache_size:
+                self._narrative_cache.popitem(last=False)
+            return narrative
+        except Exception as e:
+            # Full parse failed; salvage the command with the precompiled
+            # pattern before giving up on it.
+            match = _CMD_RE.search("".join(chunks))
+            if match and match.group(1) in VALID_COMMANDS:
+                self.recommended_command = match.group(1)
+            else:
+                self.recommended_command = "wait"
+            return f"(The Chronicler's voice falters: {e})"
+
+    @staticmethod
+    def _cache_key(game_state_json: str) -> tuple:
+        """Canonical bucketed key for a game state. Population is bucketed
+        to tens and generation to fives so minor drift still hits cache."""
+        state = orjson.loads(game_state_json)
+        return (state.get("generation", 0) // 5,
+                state.get("population", 0) // 10,
+                state.get("ep", 0),
+                state.get("world_state", {}).get("dominant_threat", "None"))
+
+    def get_player_command(self, player_input: str) -> dict:
+        """Maps the player's typed choice to a known command, locally.
+
+        With the command set baked into the structured response there is no
+        need for a second API call; unrecognized input falls back to the
+        Chronicler's recommendation, or to waiting.
+        """
+        cleaned = player_input.strip().lower().replace(" ", "_")
+        if cleaned in VALID_COMMANDS:
+            return {"command_to_execute": cleaned}
+        for command in VALID_COMMANDS:
+            if cleaned and cleaned in command:
+                return {"command_to_execute": command}
+        if not cleaned:
+            return {"command_to_execute": self.recommended_command}
+        return {"command_to_execute": "wait"}
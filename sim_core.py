@@ -0,0 +1,582 @@
+# ==============================================================================
+#
+#                           PRIMORDIA - Simulation Core
+#
+# ==============================================================================
+# The pure simulation: World, PlayerLineage and the turn-phase helpers.
+# Depends only on NumPy (Numba optional), so it can run under alternative
+# interpreters such as PyPy; matplotlib and the AI interface live in
+# primordia.py.
+# ==============================================================================
+
+import numpy as np
+from enum import IntEnum
+
+# Numba is optional: with it the per-organism step runs as a compiled,
+# parallel kernel; without it the vectorized NumPy path is used instead.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# --- Simulation Constants ---
+WORLD_WIDTH = 50
+WORLD_HEIGHT = 50
+INITIAL_POPULATION = 15
+
+# ==============================================================================
+# --- From world.py ---
+# ==============================================================================
+
+class Event(IntEnum):
+    """World events. Integer-valued so the per-tick dispatch is an int
+    compare rather than string equality, and so the event id can be passed
+    straight into a compiled kernel."""
+    NONE = 0
+    ACID_RAIN = 1
+    ICE_AGE = 2
+    NUTRIENT_BLOOM = 3
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _diffuse_pair(nutrient, toxin, nutrient_next, toxin_next,
+                      diffusion_rate, diffuse_toxin):
+        """Fused diffusion stencil: both grids are read and written in one
+        pass over the cells, into ping-pong output buffers, instead of two
+        stencils with five temporary arrays each."""
+        width, height = nutrient.shape
+        for i in prange(width):
+            for j in range(height):
+                interior = 0 < i < width - 1 and 0 < j < height - 1
+                if interior:
+                    lap = (nutrient[i - 1, j] + nutrient[i + 1, j] +
+                           nutrient[i, j - 1] + nutrient[i, j + 1] -
+                           4 * nutrient[i, j])
+                    value = nutrient[i, j] + diffusion_rate * lap
+                else:
+                    value = nutrient[i, j]
+                nutrient_next[i, j] = value if value > 0.0 else 0.0
+
+                if diffuse_toxin:
+                    if interior:
+                        lap = (toxin[i - 1, j] + toxin[i + 1, j] +
+                               toxin[i, j - 1] + toxin[i, j + 1] -
+                               4 * toxin[i, j])
+                        value = toxin[i, j] + diffusion_rate * lap
+                    else:
+                        value = toxin[i, j]
+                    # Toxins slowly decay over time
+                    value *= 0.95
+                    toxin_next[i, j] = value if value > 0.0 else 0.0
+
+
+class World:
+    """
+    Manages the 2D environment, including nutrients, and world events.
+    """
+    def __init__(self, width, height, diffusion_rate=0.1, nutrient_source_pos=None, nutrient_amount=10.0):
+        self.width = width
+        self.height = height
+        self.diffusion_rate = diffusion_rate
+        # PCG64 generator; faster than the legacy global RandomState and
+        # draws can be batched into single calls.
+        self.rng = np.random.default_rng()
+        # float32 halves the bytes per cell of the memory-bound diffusion
+        # step; the display only needs a 0-15 color scale anyway.
+        self.nutrient_a = np.zeros((width, height), dtype=np.float32)
+
+        if nutrient_source_pos is None:
+            self.nutrient_source_pos = (width // 2, height // 2)
+        else:
+            self.nutrient_source_pos = nutrient_source_pos
+
+        self.nutrient_amount = nutrient_amount
+        self.nutrient_a[self.nutrient_source_pos] = self.nutrient_amount
+
+        # For Phase 4 Gameplay
+        self.active_event = Event.NONE
+        self.toxin_grid = np.zeros((width, height), dtype=np.float32)
+        # True while the toxin grid holds anything worth diffusing; spares
+        # the no-toxin early game a full-grid scan every tick.
+        self.toxin_dirty = False
+
+        # Ping-pong output buffers for the fused diffusion kernel.
+        self._nutrient_next = np.zeros_like(self.nutrient_a)
+        self._toxin_next = np.zeros_like(self.toxin_grid)
+        # Scratch Laplacian for the fallback stencil; reused for both grids.
+        self._lap = np.empty((width - 2, height - 2), dtype=np.float32)
+
+    def update_environment(self):
+        """Updates the environment by diffusing nutrients and applying world events."""
+        diffuse_toxin = self.toxin_dirty
+
+        if NUMBA_AVAILABLE:
+            # Fused stencil: one pass reads and writes both grids.
+            _diffuse_pair(self.nutrient_a, self.toxin_grid,
+                          self._nutrient_next, self._toxin_next,
+                          self.diffusion_rate, diffuse_toxin)
+            self.nutrient_a, self._nutrient_next = self._nutrient_next, self.nutrient_a
+            if diffuse_toxin:
+                self.toxin_grid, self._toxin_next = self._toxin_next, self.toxin_grid
+        else:
+            # --- Nutrient Diffusion (from your code) ---
+            # Accumulated into the preallocated scratch buffer so no
+            # intermediate arrays are created on the per-tick path.
+            np.add(self.nutrient_a[:-2, 1:-1],       # Up
+                   self.nutrient_a[2:, 1:-1],        # Down
+                   out=self._lap)
+            self._lap += self.nutrient_a[1:-1, :-2]  # Left
+            self._lap += self.nutrient_a[1:-1, 2:]   # Right
+            self._lap -= 4 * self.nutrient_a[1:-1, 1:-1]
+            self._lap *= self.diffusion_rate
+            self.nutrient_a[1:-1, 1:-1] += self._lap
+            np.clip(self.nutrient_a, 0, None, out=self.nutrient_a)
+
+            # --- Toxin Diffusion and Decay ---
+            if diffuse_toxin:
+                np.add(self.toxin_grid[:-2, 1:-1], self.toxin_grid[2:, 1:-1],
+                       out=self._lap)
+                self._lap += self.toxin_grid[1:-1, :-2]
+                self._lap += self.toxin_grid[1:-1, 2:]
+                self._lap -= 4 * self.toxin_grid[1:-1, 1:-1]
+                self._lap *= self.diffusion_rate
+                self.toxin_grid[1:-1, 1:-1] += self._lap
+                # Toxins slowly decay over time
+                self.toxin_grid *= 0.95
+                np.clip(self.toxin_grid, 0, None, out=self.toxin_grid)
+
+        # Once decay has pushed every cell below epsilon, zero the grid and
+        # skip the toxin stencil until something writes toxins again.
+        if diffuse_toxin and self.toxin_grid.max() < 1e-6:
+            self.toxin_grid[:] = 0.0
+            self.toxin_dirty = False
+
+        self.nutrient_a[self.nutrient_source_pos] = self.nutrient_amount
+
+        # --- Apply Event Effects (Phase 4) ---
+        if self.active_event == Event.ACID_RAIN:
+            # Acid rain slightly increases toxin levels everywhere
+            self.toxin_grid += 0.005
+            self.toxin_dirty = True
+        elif self.active_event == Event.ICE_AGE:
+            # Ice age halves nutrient replenishment
+            self.nutrient_a[self.nutrient_source_pos] = self.nutrient_amount / 2
+
+    def get_nutrient(self, x, y):
+        return self.nutrient_a[x, y]
+
+    def consume_nutrient(self, x, y, amount):
+        current_amount = self.nutrient_a[x, y]
+        consumed = min(current_amount, amount)
+        self.nutrient_a[x, y] -= consumed
+        return consumed
+
+    def get_toxin(self, x, y):
+        return self.toxin_grid[x, y]
+
+    def find_spawn_location(self):
+        return self.rng.integers(0, self.width), self.rng.integers(0, self.height)
+
+    def find_spawn_locations(self, count):
+        """Batched spawn draw: one generator call per axis for all positions."""
+        xs = self.rng.integers(0, self.width, size=count, dtype=np.int16)
+        ys = self.rng.integers(0, self.height, size=count, dtype=np.int16)
+        return xs, ys
+
+# ==============================================================================
+# --- From organism.py ---
+# ==============================================================================
+
+# Fixed column order for the genome matrix. Each organism is a row of
+# gene values; helper code translates to/from the player-facing dict.
+GENE_NAMES = ('MetabolismRate', 'MovementCost', 'BaseMetabolism',
+              'SensoryRange', 'ToxinBResistance')
+
+# Genome-matrix column indices, resolved once at import. The per-tick code
+# indexes columns directly instead of re-scanning GENE_NAMES on every call.
+(METABOLISM_RATE, MOVEMENT_COST, BASE_METABOLISM,
+ SENSORY_RANGE, TOXIN_B_RESISTANCE) = range(len(GENE_NAMES))
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _step_organisms(nutrient, toxin, alive, xs, ys, energy, sensory,
+                        mov_cost, metab_rate, base_metab, resist,
+                        width, height):
+        """One sense/move/eat/metabolize pass, one organism per prange lane.
+
+        Dead slots are skipped via the alive mask. Reproduction and death
+        are handled in Python afterwards; their variable-length output
+        does not fit nopython mode.
+
+        Eating is kept out of the parallel region: it read-modify-writes
+        the shared nutrient grid, and two lanes on the same cell would
+        both read the full supply before either subtracts. A sequential
+        pass after the parallel one consumes in slot order, so a cell
+        never yields more than it holds.
+        """
+        for i in prange(xs.shape[0]):
+            if not alive[i]:
+                continue
+            # Sense: head for the richest cell in the neighborhood.
+            r = sensory[i]
+            dx, dy = 0, 0
+            if r == 1:
+                # Specialized 3x3 path: nearly every organism has the base
+                # sensory range, so unroll the 8 neighbors and pick the
+                # argmax with a compare chain the compiler can keep
+                # branch-free. Enumeration order matches the generic loop.
+                x, y = xs[i], ys[i]
+                xm, xp = (x - 1) % width, (x + 1) % width
+                ym, yp = (y - 1) % height, (y + 1) % height
+                n0 = nutrient[xm, ym]
+                n1 = nutrient[xm, y]
+                n2 = nutrient[xm, yp]
+                n3 = nutrient[x, ym]
+                n4 = nutrient[x, yp]
+                n5 = nutrient[xp, ym]
+                n6 = nutrient[xp, y]
+                n7 = nutrient[xp, yp]
+                best = n0
+                k = 0
+                if n1 > best: best = n1; k = 1
+                if n2 > best: best = n2; k = 2
+                if n3 > best: best = n3; k = 3
+                if n4 > best: best = n4; k = 4
+                if n5 > best: best = n5; k = 5
+                if n6 > best: best = n6; k = 6
+                if n7 > best: best = n7; k = 7
+                if k < 3:
+                    dx, dy = -1, k - 1
+                elif k == 3:
+                    dx, dy = 0, -1
+                elif k == 4:
+                    dx, dy = 0, 1
+                else:
+                    dx, dy = 1, k - 6
+            else:
+                best = -1.0
+                for ox in range(-r, r + 1):
+                    for oy in range(-r, r + 1):
+                        if ox == 0 and oy == 0:
+                            continue
+                        nx = (xs[i] + ox) % width
+                        ny = (ys[i] + oy) % height
+                        level = nutrient[nx, ny]
+                        if level > best:
+                            best = level
+                            dx = (ox > 0) - (ox < 0)
+                            dy = (oy > 0) - (oy < 0)
+            if dx == 0 and dy == 0:
+                dx = np.random.randint(-1, 2)
+                dy = np.random.randint(-1, 2)
+
+            # Move
+            xs[i] = (xs[i] + dx) % width
+            ys[i] = (ys[i] + dy) % height
+            energy[i] -= mov_cost[i]
+
+            # Metabolize
+            energy[i] -= base_metab[i]
+            damage = toxin[xs[i], ys[i]] - resist[i]
+            if damage > 0.0:
+                energy[i] -= damage * 10.0
+
+        # Eat: sequential so co-located organisms draw down the cell one
+        # after another instead of racing on the shared grid.
+        for i in range(xs.shape[0]):
+            if not alive[i]:
+                continue
+            amount = metab_rate[i] * 10.0
+            available = nutrient[xs[i], ys[i]]
+            consumed = available if available < amount else amount
+            nutrient[xs[i], ys[i]] -= consumed
+            energy[i] += consumed * 5.0
+
+# ==============================================================================
+# --- Synthesized lineage.py (Phase 4) ---
+# ==============================================================================
+
+class PlayerLineage:
+    """Manages the player's entire collection of organisms and evolutionary path.
+
+    Organism state is stored structure-of-arrays style: parallel NumPy
+    arrays for positions, energy and genomes. Each per-tick phase (sense,
+    move, eat, metabolize) is a handful of whole-population array
+    operations instead of a Python loop over organism objects.
+
+    The arrays are sized to a capacity rather than the live population:
+    deaths only clear a slot's bit in the `alive` mask, births reuse free
+    slots, and the arrays are compacted only when more than half the
+    capacity is tombstones. This avoids rebuilding every array on every
+    tick just because a few organisms died or were born.
+    """
+    REPRODUCTION_ENERGY = 150.0
+
+    # Neighborhood offsets and their signs, keyed by sensory range. Shared
+    # across lineages since they depend only on the range value.
+    _offset_cache = {}
+
+    def __init__(self, world):
+        self.world = world
+        self.base_genome = {
+            'MetabolismRate': 0.1,
+            'MovementCost': 0.2,
+            'BaseMetabolism': 0.5,
+            'SensoryRange': 1,
+            'ToxinBResistance': 0.0
+        }
+        # SoA organism state: row i across these arrays is one organism.
+        # int16 positions are plenty for a 50x50 grid and keep the arrays
+        # cache-friendly.
+        self.xs = np.empty(0, dtype=np.int16)
+        self.ys = np.empty(0, dtype=np.int16)
+        self.dxs = np.empty(0, dtype=np.int16)
+        self.dys = np.empty(0, dtype=np.int16)
+        self.energy = np.empty(0, dtype=np.float64)
+        self.genomes = np.empty((0, len(GENE_NAMES)), dtype=np.float32)
+        self.alive = np.empty(0, dtype=bool)
+        self.generation = 1
+        self.evolutionary_potential = 100
+        self.milestone_pop_50_reached = False
+        self.rng = np.random.default_rng()
+
+        # The base genome as a genome-matrix row, refreshed by evolve_gene.
+        self._base_gene_row = self._base_genome_row()
+        self.spawn_organisms(INITIAL_POPULATION)
+
+    def _base_genome_row(self):
+        return np.array([self.base_genome[g] for g in GENE_NAMES], dtype=np.float32)
+
+    @property
+    def population(self):
+        return int(np.count_nonzero(self.alive))
+
+    def spawn_organisms(self, count):
+        xs, ys = self.world.find_spawn_locations(count)
+        self._insert_organisms(xs, ys,
+                               np.full(count, 100.0),
+                               np.tile(self._base_gene_row, (count, 1)))
+
+    def _insert_organisms(self, xs, ys, energy, genomes):
+        """Writes new organisms into free (dead) slots, growing capacity
+        only when the free list runs out."""
+        n = xs.shape[0]
+        free = np.flatnonzero(~self.alive)
+        if free.shape[0] < n:
+            self._grow(n - free.shape[0])
+            free = np.flatnonzero(~self.alive)
+        slots = free[:n]
+        self.xs[slots] = xs
+        self.ys[slots] = ys
+        self.dxs[slots] = 0
+        self.dys[slots] = 0
+        self.energy[slots] = energy
+        self.genomes[slots] = genomes
+        self.alive[slots] = True
+
+    def _grow(self, extra):
+        old_cap = self.alive.shape[0]
+        pad = max(old_cap, extra, 16)
+        self.xs = np.concatenate([self.xs, np.zeros(pad, dtype=np.int16)])
+        self.ys = np.concatenate([self.ys, np.zeros(pad, dtype=np.int16)])
+        self.dxs = np.concatenate([self.dxs, np.zeros(pad, dtype=np.int16)])
+        self.dys = np.concatenate([self.dys, np.zeros(pad, dtype=np.int16)])
+        self.energy = np.concatenate([self.energy, np.zeros(pad)])
+        self.genomes = np.concatenate(
+            [self.genomes, np.zeros((pad, len(GENE_NAMES)), dtype=np.float32)])
+        self.alive = np.concatenate([self.alive, np.zeros(pad, dtype=bool)])
+
+    def _compact(self):
+        keep = np.flatnonzero(self.alive)
+        self.xs = self.xs[keep]
+        self.ys = self.ys[keep]
+        self.dxs = self.dxs[keep]
+        self.dys = self.dys[keep]
+        self.energy = self.energy[keep]
+        self.genomes = self.genomes[keep]
+        self.alive = np.ones(keep.shape[0], dtype=bool)
+
+    def step(self):
+        """One sense/move/eat/metabolize pass over the whole population."""
+        if NUMBA_AVAILABLE:
+            sensory = self.genomes[:, SENSORY_RANGE].astype(np.int64)
+            _step_organisms(self.world.nutrient_a, self.world.toxin_grid,
+                            self.alive, self.xs, self.ys, self.energy, sensory,
+                            self.genomes[:, MOVEMENT_COST],
+                            self.genomes[:, METABOLISM_RATE],
+                            self.genomes[:, BASE_METABOLISM],
+                            self.genomes[:, TOXIN_B_RESISTANCE],
+                            self.world.width, self.world.height)
+            np.clip(self.world.nutrient_a, 0, None, out=self.world.nutrient_a)
+        else:
+            live = np.flatnonzero(self.alive)
+            self.sense(live)
+            self.move(live)
+            self.eat(live)
+            self.metabolize(live)
+
+    def sense(self, live):
+        """Simple strategy: move towards the neighboring cell with the most nutrients.
+
+        Vectorized: for each distinct sensory range, gather the nutrient
+        levels of every organism's neighborhood in one fancy-indexed read
+        and argmax across the neighbor axis. Offsets are enumerated in the
+        same (dx-major, dy-minor) order as the old per-organism loop so
+        ties resolve identically.
+        """
+        ranges = self.genomes[live, SENSORY_RANGE].astype(np.int64)
+        for r in np.unique(ranges):
+            idx = live[ranges == r]
+            if r <= 0:
+                continue  # nothing sensed; handled by the random walk below
+            offsets, signs = self._sense_offsets(int(r))
+            nxs = (self.xs[idx][:, None] + offsets[:, 0]) % self.world.width
+            nys = (self.ys[idx][:, None] + offsets[:, 1]) % self.world.height
+            best = np.argmax(self.world.nutrient_a[nxs, nys], axis=1)
+            self.dxs[idx] = signs[best, 0]
+            self.dys[idx] = signs[best, 1]
+
+        # Organisms that sensed nothing wander randomly.
+        undecided = live[(self.dxs[live] == 0) & (self.dys[live] == 0)]
+        if undecided.shape[0]:
+            self.dxs[undecided] = self.rng.integers(-1, 2, size=undecided.shape[0])
+            self.dys[undecided] = self.rng.integers(-1, 2, size=undecided.shape[0])
+
+    @classmethod
+    def _sense_offsets(cls, r):
+        """(dx, dy) offsets for sensory range r, in the same (dx-major,
+        dy-minor) order the old per-organism loop used, plus their signs.
+        Built once per range value and cached."""
+        cached = cls._offset_cache.get(r)
+        if cached is None:
+            offsets = np.mgrid[-r:r + 1, -r:r + 1].reshape(2, -1).T
+            offsets = offsets[(offsets[:, 0] != 0) | (offsets[:, 1] != 0)]
+            cached = (offsets, np.sign(offsets).astype(np.int16))
+            cls._offset_cache[r] = cached
+        return cached
+
+    def move(self, live):
+        self.xs[live] = (self.xs[live] + self.dxs[live]) % self.world.width
+        self.ys[live] = (self.ys[live] + self.dys[live]) % self.world.height
+        self.dxs[:] = 0
+        self.dys[:] = 0
+        self.energy[live] -= self.genomes[live, MOVEMENT_COST]
+
+    def eat(self, live):
+        amount_to_eat = self.genomes[live, METABOLISM_RATE] * 10
+        cells = (self.xs[live], self.ys[live])
+        # Co-located organisms share a cell's supply: accumulate each
+        # cell's total demand, then scale every eater's intake so no cell
+        # yields more than it holds. Total energy gained stays at 5x the
+        # nutrients actually removed, like the sequential baseline.
+        demand = np.zeros_like(self.world.nutrient_a)
+        np.add.at(demand, cells, amount_to_eat)
+        available = self.world.nutrient_a[cells]
+        scale = np.minimum(1.0, available / np.maximum(demand[cells], 1e-12))
+        consumed = amount_to_eat * scale
+        np.subtract.at(self.world.nutrient_a, cells, consumed)
+        np.clip(self.world.nutrient_a, 0, None, out=self.world.nutrient_a)
+        self.energy[live] += consumed * 5
+
+    def metabolize(self, live):
+        self.energy[live] -= self.genomes[live, BASE_METABOLISM]
+
+        # Metabolize toxins (Phase 4)
+        toxin_levels = self.world.toxin_grid[self.xs[live], self.ys[live]]
+        resistance = self.genomes[live, TOXIN_B_RESISTANCE]
+        damage = np.maximum(0, toxin_levels - resistance) * 10
+        self.energy[live] -= damage
+
+    def cull_and_reproduce(self):
+        """Halves reproducers' energy, spawns their mutated offspring into
+        free slots, and tombstones the dead. Reproduction stays in Python
+        since each birth draws a fresh mutated genome from the lineage's
+        base genome."""
+        live = np.flatnonzero(self.alive)
+        reproducers = live[self.energy[live] >= self.REPRODUCTION_ENERGY]
+        n_new = reproducers.shape[0]
+        if n_new:
+            self.energy[reproducers] /= 2
+            off_xs = (self.xs[reproducers] + self.rng.integers(-1, 2, n_new)) % self.world.width
+            off_ys = (self.ys[reproducers] + self.rng.integers(-1, 2, n_new)) % self.world.height
+            off_energy = self.energy[reproducers].copy()
+            # One multiplicative-noise draw covers every birth this tick:
+            # offspring mutate from the lineage's BASE genome, not the parent.
+            factors = 1.0 + self.rng.uniform(-0.1, 0.1, size=(n_new, len(GENE_NAMES)))
+            off_genomes = (self._base_gene_row * factors).astype(np.float32)
+
+        # Deaths only flip a bit; the slot becomes reusable.
+        self.alive[live[self.energy[live] <= 0]] = False
+        if n_new:
+            self._insert_organisms(off_xs, off_ys, off_energy, off_genomes)
+
+        # Compact only once tombstones dominate the capacity.
+        cap = self.alive.shape[0]
+        if cap > 64 and np.count_nonzero(self.alive) < cap // 2:
+            self._compact()
+
+    def evolve_gene(self, gene, delta, cost):
+        if self.evolutionary_potential >= cost:
+            self.base_genome[gene] += delta
+            self.evolutionary_potential -= cost
+            print(f"[EVOLUTION] Base {gene} modified by {delta}. {cost} EP spent.")
+
+            # --- Apply Trade-offs ---
+            if gene == "ToxinBResistance":
+                self.base_genome["BaseMetabolism"] += 0.01
+                print("[TRADE-OFF] BaseMetabolism slightly increased.")
+            self._base_gene_row = self._base_genome_row()
+            return True
+        else:
+            print(f"[EVOLUTION FAILED] Not enough EP. Required: {cost}, Have: {self.evolutionary_potential}")
+            return False
+
+
+# ==============================================================================
+# --- Core Game Logic (from main.py and Phase 4) ---
+# ==============================================================================
+
+def run_simulation_steps(steps, world, lineage):
+    """Runs the simulation for a given number of steps."""
+    for step in range(steps):
+        if lineage.population == 0: break
+
+        world.update_environment()
+        lineage.step()
+        lineage.cull_and_reproduce()
+
+def check_for_achievements(lineage):
+    """Checks for milestones and awards EP."""
+    if lineage.population > 50 and not lineage.milestone_pop_50_reached:
+        print("\n[ACHIEVEMENT] Population surpassed 50! +75 EP")
+        lineage.evolutionary_potential += 75
+        lineage.milestone_pop_50_reached = True
+
+WORLD_EVENTS = (Event.ACID_RAIN, Event.ICE_AGE, Event.NUTRIENT_BLOOM)
+
+def world_event_phase(world):
+    """Triggers random world events."""
+    # One batched draw from the world's generator covers both the event
+    # roll and the event pick for the turn.
+    roll, pick = world.rng.random(2)
+    if roll < 0.25: # 25% chance of an event each turn
+        chosen_event = WORLD_EVENTS[int(pick * len(WORLD_EVENTS))]
+        print(f"\n[WORLD EVENT] A strange phenomenon occurs: {chosen_event.name.replace('_', ' ').title()}!")
+        world.active_event = chosen_event
+        if chosen_event == Event.NUTRIENT_BLOOM:
+            world.nutrient_amount *= 1.5 # Temporarily boost nutrient source
+    else:
+        if world.active_event == Event.NUTRIENT_BLOOM:
+            world.nutrient_amount /= 1.5 # Revert bloom effect
+        world.active_event = Event.NONE
+
+def print_status_report(lineage):
+    print("\n--- Lineage Status Report ---")
+    print(f"  Generation: {lineage.generation} | Population: {lineage.population}")
+    print(f"  Evolutionary Potential (EP): {lineage.evolutionary_potential}")
+    print("  Base Genome:")
+    for gene, value in lineage.base_genome.items():
+        print(f"    - {gene}: {value:.3f}")
+    print("-----------------------------")
@@ -0,0 +1,38 @@
+# Regression tests for sim_core. Run with `python -m pytest test_sim_core.py`.
+
+import subprocess
+import sys
+
+import pytest
+
+import sim_core
+
+# The game loop runs the simulation through asyncio.to_thread, mirroring
+# primordia.py. Numba's first compilation of the parallel kernels from a
+# worker thread can hang the process, which is why game_loop warms them on
+# the main thread first; this exercises that exact sequence. A subprocess
+# with a timeout turns a regression (hang, including at interpreter exit)
+# into a test failure instead of a stuck suite.
+_WORKER_THREAD_SCRIPT = """
+import asyncio
+import sim_core
+
+world = sim_core.World(sim_core.WORLD_WIDTH, sim_core.WORLD_HEIGHT)
+lineage = sim_core.PlayerLineage(world)
+sim_core.run_simulation_steps(1, world, lineage)  # main-thread warm-up
+
+async def main():
+    await asyncio.to_thread(sim_core.run_simulation_steps, 50, world, lineage)
+
+asyncio.run(main())
+print("WORKER_THREAD_OK")
+"""
+
+
+@pytest.mark.skipif(not sim_core.NUMBA_AVAILABLE, reason="numba not installed")
+def test_numba_path_completes_through_worker_thread():
+    result = subprocess.run(
+        [sys.executable, "-c", _WORKER_THREAD_SCRIPT],
+        capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    assert "WORKER_THREAD_OK" in result.stdout